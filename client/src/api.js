@@ -23,10 +23,42 @@ export async function uploadDocument(file) {
   return handleResponse(response);
 }
 
-export async function fetchPages(docId, offset = 0, limit = 10) {
+export async function fetchPages(docId, offset = 0, limit = 10, onPage = null) {
   const params = new URLSearchParams({ offset, limit });
   const response = await fetch(`${API_BASE}/api/document/${docId}/pages?${params.toString()}`);
-  return handleResponse(response);
+  if (!response.ok) {
+    return handleResponse(response);
+  }
+
+  // The server streams NDJSON: a `{ total_pages }` header line followed by one
+  // line per rendered page. Parse lines as they arrive so callers can show
+  // pages progressively through `onPage`.
+  const result = { pages: [], total_pages: 0 };
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffered = '';
+
+  const consumeLine = (line) => {
+    if (!line.trim()) return;
+    const item = JSON.parse(line);
+    if ('total_pages' in item) {
+      result.total_pages = item.total_pages;
+      return;
+    }
+    result.pages.push(item);
+    if (onPage) onPage(item);
+  };
+
+  for (;;) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffered += decoder.decode(value, { stream: true });
+    const lines = buffered.split('\n');
+    buffered = lines.pop();
+    lines.forEach(consumeLine);
+  }
+  consumeLine(buffered + decoder.decode());
+  return result;
 }
 
 export async function sliceDocument(docId, startPage, endPage, pages = []) {
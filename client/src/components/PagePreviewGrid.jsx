@@ -1,4 +1,5 @@
 import React, { useEffect, useRef } from 'react';
+import { API_BASE } from '../api.js';
 
 const PagePreviewGrid = ({
   pages,
@@ -47,7 +48,7 @@ const PagePreviewGrid = ({
             className={`page-preview ${selectedPages.has(page.index) ? 'page-preview--selected' : ''}`}
             onClick={() => onToggleSelect(page.index)}
           >
-            <img loading="lazy" src={page.preview} alt={`Page ${page.index}`} />
+            <img loading="lazy" src={`${API_BASE}${page.url}`} alt={`Page ${page.index}`} />
             <span>Page {page.index}</span>
           </button>
         ))}
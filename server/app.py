@@ -1,18 +1,73 @@
 """Flask application that exposes PDF management endpoints."""
 from __future__ import annotations
 
+import threading
 from pathlib import Path
 from typing import Any, Dict
 
-from flask import Flask, jsonify, request, send_file
+import orjson
+from flask import Flask, Response, jsonify, request, send_file, stream_with_context
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
 
-from .pdf_manager import PdfService
+from .pdf_manager import PREVIEW_QUALITY, PREVIEW_SCALE, PdfService
+
+
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider backed by ``orjson`` for faster (de)serialization."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize ``obj`` to a JSON string."""
+
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        """Deserialize a JSON document from ``s``."""
+
+        return orjson.loads(s)
 
 
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 CORS(app)
-service = PdfService(Path(__file__).resolve().parent / "storage")
+STORAGE_DIR = Path(__file__).resolve().parent / "storage"
+_service: PdfService | None = None
+_service_lock = threading.Lock()
+
+
+def get_service() -> PdfService:
+    """Return the shared :class:`PdfService`, creating it on first use.
+
+    The service is deliberately not built at import time. Preview workers are
+    started with the ``spawn`` method, which re-imports the main module in each
+    worker; under ``python -m server.app`` an import-time service would open the
+    metadata database and rescan storage from every render worker.
+    """
+
+    global _service
+    # Fast path without the lock: once set, ``_service`` never changes, and
+    # reading a module global is atomic. Only the first creation is serialized.
+    service = _service
+    if service is not None:
+        return service
+    with _service_lock:
+        if _service is None:
+            _service = PdfService(STORAGE_DIR)
+        return _service
+
+
+def _json_body() -> Dict[str, Any] | None:
+    """Parse the raw request body as a JSON object.
+
+    Returns:
+        The decoded object, or ``None`` when the body is not a JSON object.
+    """
+
+    try:
+        payload = orjson.loads(request.get_data())
+    except orjson.JSONDecodeError:
+        return None
+    return payload if isinstance(payload, dict) else None
 
 
 def _json_error(message: str, status: int = 400):
@@ -34,7 +89,7 @@ def healthcheck():
 def list_documents():
     """List all documents in storage."""
 
-    return {"documents": service.list_documents()}
+    return {"documents": get_service().list_documents()}
 
 
 @app.post("/api/upload")
@@ -44,7 +99,7 @@ def upload_document():
     file = request.files.get("file")
     if not file:
         return _json_error("Missing file upload")
-    metadata = service.register_upload(file)
+    metadata = get_service().register_upload(file)
     return {"document": metadata.as_dict()}
 
 
@@ -53,18 +108,33 @@ def download_document(doc_id: str):
     """Download the binary PDF for a given document."""
 
     try:
-        meta = service.get_document(doc_id)
+        meta = get_service().get_document(doc_id)
     except KeyError as exc:
         return _json_error(str(exc), status=404)
-    return send_file(meta.path, as_attachment=True, download_name=meta.name)
+    # Stored PDFs only change if they are replaced on disk, so an ETag built from
+    # the file's identity lets browsers revalidate with a 304 instead of
+    # downloading the whole document again.
+    stat = meta.path.stat()
+    response = send_file(
+        meta.path,
+        as_attachment=True,
+        download_name=meta.name,
+        conditional=True,
+        etag=f"{meta.doc_id}-{stat.st_mtime_ns}-{stat.st_size}",
+        last_modified=stat.st_mtime,
+    )
+    response.headers["Cache-Control"] = "private, max-age=60, must-revalidate"
+    return response
 
 
 @app.get("/api/document/<doc_id>/pages")
 def page_previews(doc_id: str):
-    """Return previews for each page of the document.
+    """Stream preview URLs for the pages of the document as NDJSON.
 
     Supports incremental loading by accepting ``offset`` and ``limit`` query
-    parameters to restrict the preview window.
+    parameters to restrict the preview window. The first line of the response is
+    ``{"total_pages": N}``; every following line is one ``{"index", "url"}``
+    object pointing at the page's JPEG preview endpoint.
     """
 
     try:
@@ -75,19 +145,57 @@ def page_previews(doc_id: str):
         return _json_error("offset and limit must be integers")
 
     try:
-        previews = service.get_page_previews(doc_id, offset=offset, limit=limit)
+        service = get_service()
+        previews = service.iter_page_previews(doc_id, offset=offset, limit=limit)
+        total_pages = service.get_document(doc_id).pages
     except KeyError as exc:
         return _json_error(str(exc), status=404)
     except ValueError as exc:
         return _json_error(str(exc))
-    return previews
+
+    def _iter():
+        yield orjson.dumps({"total_pages": total_pages}) + b"\n"
+        for item in previews:
+            yield orjson.dumps(item) + b"\n"
+
+    return Response(stream_with_context(_iter()), mimetype="application/x-ndjson")
+
+
+@app.get("/api/document/<doc_id>/page/<int:page_number>/preview.jpg")
+def page_preview_image(doc_id: str, page_number: int):
+    """Return the JPEG preview for a single one-based page number."""
+
+    service = get_service()
+    try:
+        data = service.render_page_jpeg(doc_id, page_number - 1)
+        meta = service.get_document(doc_id)
+    except KeyError as exc:
+        return _json_error(str(exc), status=404)
+    except ValueError as exc:
+        return _json_error(str(exc), status=404)
+    except RuntimeError as exc:
+        return _json_error(str(exc), status=500)
+
+    # Stored PDFs only change if they are replaced on disk, which the service
+    # picks up on restart (see the metadata sidecar). The file's mtime is part of
+    # the ETag, so after an hour browsers revalidate and fetch the new rendering
+    # of a replaced file. The bytes are handed to the response as-is rather than
+    # wrapped in a file object and re-read in chunks.
+    response = Response(data, mimetype="image/jpeg")
+    response.set_etag(
+        f"{doc_id}-{meta.mtime_ns}-{page_number - 1}-{PREVIEW_SCALE}-{PREVIEW_QUALITY}"
+    )
+    response.headers["Cache-Control"] = "public, max-age=3600"
+    return response.make_conditional(request)
 
 
 @app.post("/api/document/<doc_id>/slice")
 def slice_document(doc_id: str):
     """Create a new PDF containing only the specified page range."""
 
-    payload: Dict[str, Any] = request.get_json(force=True)
+    payload = _json_body()
+    if payload is None:
+        return _json_error("Request body must be a JSON object")
     raw_pages = payload.get("pages")
     page_numbers = None
     if isinstance(raw_pages, list) and raw_pages:
@@ -99,7 +207,7 @@ def slice_document(doc_id: str):
     start_page = int(payload.get("startPage", 1))
     end_page = int(payload.get("endPage", start_page))
     try:
-        meta = service.slice_document(doc_id, start_page, end_page, page_numbers)
+        meta = get_service().slice_document(doc_id, start_page, end_page, page_numbers)
     except (KeyError, ValueError) as exc:
         return _json_error(str(exc))
     return {"document": meta.as_dict()}
@@ -110,7 +218,7 @@ def delete_document(doc_id: str):
     """Remove a document from storage."""
 
     try:
-        service.delete_document(doc_id)
+        get_service().delete_document(doc_id)
     except KeyError as exc:
         return _json_error(str(exc), status=404)
     return {"status": "deleted", "doc_id": doc_id}
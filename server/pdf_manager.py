@@ -1,22 +1,156 @@
 """Utility classes for managing PDF files within the Flask service."""
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
+from bisect import bisect_right
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from functools import cached_property
 from io import BytesIO
-import base64
+import multiprocessing
+import os
+import shutil
+import sqlite3
+import threading
 import uuid
 from pathlib import Path
-from typing import Dict, Iterable, List, Sequence
+from tempfile import SpooledTemporaryFile
+from typing import Dict, Iterable, Iterator, List, Sequence
 
 try:  # pragma: no cover - exercised via runtime usage
     import pypdfium2 as pdfium
+    import pypdfium2.raw as pdfium_c
 except ModuleNotFoundError:  # pragma: no cover - helps local tests without preview deps
     pdfium = None
+    pdfium_c = None
 
 from pypdf import PdfReader, PdfWriter
+from pypdf.errors import PyPdfError
 
+# Scale used for every page preview; also part of the preview cache key.
+PREVIEW_SCALE = 0.8
 
-@dataclass
+# JPEG quality used for page previews.
+PREVIEW_QUALITY = 75
+
+# Upper bound on the total size of cached preview images kept in memory.
+MAX_PREVIEW_BYTES = 256 * 1024 * 1024
+
+# Largest number of pages a single slice request may copy.
+MAX_PAGES_PER_SLICE = 1000
+
+
+def _render_page_jpeg(path: str, index: int, scale: float, quality: int) -> bytes:
+    """Render a single page to JPEG bytes inside a worker process.
+
+    Args:
+        path: Filesystem path of the PDF to open.
+        index: Zero-based page index to render.
+        scale: Rendering scale passed through to PDFium.
+        quality: JPEG quality setting (1-95).
+
+    Returns:
+        The encoded JPEG bytes.
+    """
+
+    buffer = BytesIO()
+    pdf = pdfium.PdfDocument(path)
+    try:
+        page = pdf[index]
+        try:
+            # Render straight into RGBX byte order: PIL then wraps PDFium's buffer
+            # without copying it and the JPEG encoder reads RGBX natively, so no
+            # colour conversion pass is needed. The image borrows the bitmap's
+            # memory, so it has to be encoded before the bitmap is closed.
+            bitmap = page.render(
+                scale=scale,
+                force_bitmap_format=pdfium_c.FPDFBitmap_BGRx,
+                rev_byteorder=True,
+            )
+            try:
+                image = bitmap.to_pil()
+                try:
+                    image.save(buffer, format="JPEG", quality=quality, optimize=False)
+                finally:
+                    image.close()
+            finally:
+                bitmap.close()
+        finally:
+            page.close()
+    finally:
+        pdf.close()
+    return buffer.getvalue()
+
+
+def _new_render_pool() -> ProcessPoolExecutor:
+    """Create the worker pool that runs :func:`_render_page_jpeg`.
+
+    Rasterizing pages and JPEG encoding are CPU-bound, so previews are rendered
+    in a small pool of worker processes instead of the request thread. Worker
+    processes are only spawned once the first preview is requested, and each one
+    is replaced after a fixed number of renders so memory PDFium or PIL fail to
+    hand back to the OS cannot accumulate in a long-running server.
+
+    Workers use the ``spawn`` start method. Recycling workers requires a
+    non-fork context anyway, and forking a threaded web server is unsafe. A
+    spawned worker re-imports the main module and this one, so neither may do
+    real work at import time: the app builds its ``PdfService`` lazily.
+    """
+
+    return ProcessPoolExecutor(
+        max_workers=min(os.cpu_count() or 1, 4),
+        mp_context=multiprocessing.get_context("spawn"),
+        max_tasks_per_child=200,
+    )
+
+
+_RENDER_POOL = _new_render_pool()
+_RENDER_POOL_LOCK = threading.Lock()
+
+
+def _run_render(path: str, index: int, scale: float, quality: int) -> bytes:
+    """Render a page through the shared pool, rebuilding the pool if it broke.
+
+    A worker that dies mid-render (a PDFium crash on a hostile file, the OOM
+    killer) leaves the executor permanently broken and fails every render in
+    flight, so the pool is swapped for a fresh one. Any of those renders may
+    have caused the crash, so each is retried once in a throwaway single-worker
+    pool: a page that crashes PDFium every time then only breaks its own
+    worker, not the replacement shared pool, and the resulting ``RuntimeError``
+    can truthfully name that page.
+
+    Args:
+        path: Filesystem path of the PDF to open.
+        index: Zero-based page index to render.
+        scale: Rendering scale passed through to PDFium.
+        quality: JPEG quality setting (1-95).
+
+    Returns:
+        The encoded JPEG bytes.
+    """
+
+    global _RENDER_POOL
+    pool = _RENDER_POOL
+    try:
+        return pool.submit(_render_page_jpeg, path, index, scale, quality).result()
+    except BrokenProcessPool:
+        with _RENDER_POOL_LOCK:
+            # Another request may already have replaced this pool.
+            if _RENDER_POOL is pool:
+                pool.shutdown(wait=False, cancel_futures=True)
+                _RENDER_POOL = _new_render_pool()
+
+    with ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn")
+    ) as isolated:
+        try:
+            return isolated.submit(_render_page_jpeg, path, index, scale, quality).result()
+        except BrokenProcessPool as exc:
+            raise RuntimeError(f"Rendering page {index + 1} crashes the preview renderer") from exc
+
+
+@dataclass(frozen=True)
 class DocumentMeta:
     """Metadata about a single PDF stored on disk."""
 
@@ -24,68 +158,282 @@ class DocumentMeta:
     name: str
     path: Path
     pages: int
+    # Modification time of the file when it was registered. Kept out of the JSON
+    # payload; used to tell a replaced file apart in cache validators.
+    mtime_ns: int = 0
+
+    @cached_property
+    def as_dict_cached(self) -> Dict[str, str | int]:
+        """JSON-serializable payload, built once since the metadata never changes."""
+
+        return {"doc_id": self.doc_id, "name": self.name, "path": str(self.path), "pages": self.pages}
 
     def as_dict(self) -> Dict[str, str | int]:
         """Return a JSON-serializable representation of this object."""
 
-        payload = asdict(self)
-        payload["path"] = str(self.path)
-        return payload
+        # Shallow copy so callers may modify the result without touching the cache.
+        return dict(self.as_dict_cached)
 
 
 class PdfService:
     """Service class that owns PDF storage and operations."""
 
+    # Pre-generated UUID4 strings shared by all instances. Refilled from a single
+    # ``os.urandom`` call so burst uploads do not pay one syscall per identifier.
+    _uuid_pool: deque[str] = deque()
+    _UUID_BATCH = 64
+
     def __init__(self, storage_dir: Path) -> None:
         self.storage_dir = storage_dir
         self.storage_dir.mkdir(parents=True, exist_ok=True)
         self._documents: Dict[str, DocumentMeta] = {}
+        # Page counts keyed by path and validated against the file's mtime so a
+        # PDF is parsed at most once per modification.
+        self._page_count_cache: Dict[Path, tuple[int, int]] = {}
+        # LRU cache of rendered previews keyed by (doc_id, page_index, scale, quality).
+        # Oldest entries are evicted once the total size exceeds MAX_PREVIEW_BYTES.
+        self._preview_cache: OrderedDict[tuple[str, int, float, int], bytes] = OrderedDict()
+        self._preview_cache_bytes = 0
+        # Registering, deleting and slicing (which reads the source file) a
+        # document are serialized through one of 16 lock shards picked by hashing
+        # the doc_id, so unrelated documents never contend. Renders do not take a
+        # shard, so pages of one document render in parallel; they instead
+        # re-check that the document still exists before caching their result.
+        # Structural changes to ``_documents`` additionally hold ``_global_lock``
+        # briefly so ``list_documents`` can take a consistent snapshot, and the
+        # preview LRU has its own lock because reads reorder it.
+        self._locks = [threading.Lock() for _ in range(16)]
+        self._global_lock = threading.Lock()
+        self._preview_lock = threading.Lock()
+        # Sidecar database remembering each document's display name, page count
+        # and file mtime, so restarts only re-parse PDFs that changed on disk.
+        # The connection is shared by request threads and serialized by a lock.
+        self._meta_db = sqlite3.connect(self.storage_dir / "meta.sqlite", check_same_thread=False)
+        self._db_lock = threading.Lock()
+        with self._meta_db:
+            self._meta_db.execute(
+                "CREATE TABLE IF NOT EXISTS docs ("
+                "doc_id TEXT PRIMARY KEY, name TEXT, pages INT, mtime_ns INT)"
+            )
         self._bootstrap_documents()
 
     def _bootstrap_documents(self) -> None:
-        """Populate in-memory metadata for all PDFs found in storage."""
+        """Populate in-memory metadata for all PDFs found in storage.
+
+        Files whose mtime matches the sidecar database are loaded from it
+        directly; only new or modified PDFs are parsed, and the database is then
+        brought back in sync with the storage directory.
+        """
+
+        stored = {
+            doc_id: (name, pages, mtime_ns)
+            for doc_id, name, pages, mtime_ns in self._meta_db.execute(
+                "SELECT doc_id, name, pages, mtime_ns FROM docs"
+            )
+        }
 
+        fresh: List[DocumentMeta] = []
+        stale: List[Path] = []
         for file_path in self.storage_dir.glob("*.pdf"):
-            doc_id = file_path.stem
-            if doc_id in self._documents:
-                continue
-            meta = self._build_metadata(doc_id, file_path.name, file_path)
-            self._documents[doc_id] = meta
+            row = stored.get(file_path.stem)
+            if row is not None and row[2] == file_path.stat().st_mtime_ns:
+                fresh.append(
+                    DocumentMeta(
+                        doc_id=file_path.stem,
+                        name=row[0],
+                        path=file_path,
+                        pages=row[1],
+                        mtime_ns=row[2],
+                    )
+                )
+            else:
+                stale.append(file_path)
+
+        def build(path: Path) -> DocumentMeta:
+            # Keep the display name recorded at upload time if the file is known.
+            row = stored.get(path.stem)
+            return self._build_metadata(path.stem, row[0] if row else path.name, path)
+
+        # Reading page counts is independent per file and mostly spent in I/O and
+        # zlib, so spread it over a few threads to keep cold starts short.
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            parsed = list(executor.map(build, stale))
+
+        for meta in fresh + parsed:
+            self._documents[meta.doc_id] = meta
+        with self._db_lock, self._meta_db:
+            self._meta_db.executemany(
+                "INSERT OR REPLACE INTO docs (doc_id, name, pages, mtime_ns) VALUES (?, ?, ?, ?)",
+                [
+                    (meta.doc_id, meta.name, meta.pages, meta.mtime_ns)
+                    for meta in parsed
+                ],
+            )
+            self._meta_db.executemany(
+                "DELETE FROM docs WHERE doc_id = ?",
+                [(doc_id,) for doc_id in stored if doc_id not in self._documents],
+            )
+
+    @classmethod
+    def _refill_uuid_pool(cls) -> None:
+        """Generate a batch of random UUID4 strings from one ``os.urandom`` read."""
+
+        buf = os.urandom(16 * cls._UUID_BATCH)
+        # ``version=4`` sets the RFC 4122 version and variant bits.
+        cls._uuid_pool.extend(
+            str(uuid.UUID(bytes=buf[offset : offset + 16], version=4))
+            for offset in range(0, len(buf), 16)
+        )
+
+    def _next_uuid(self) -> str:
+        """Return a fresh UUID4 string, refilling the shared pool when it runs dry."""
+
+        while True:
+            try:
+                return self._uuid_pool.popleft()
+            except IndexError:
+                self._refill_uuid_pool()
 
-    def _build_metadata(self, doc_id: str, name: str, path: Path) -> DocumentMeta:
-        """Create metadata for the given file."""
+    def _lock_for(self, doc_id: str) -> threading.Lock:
+        """Return the lock shard guarding ``doc_id``."""
 
-        reader = PdfReader(path)
-        return DocumentMeta(doc_id=doc_id, name=name, path=path, pages=len(reader.pages))
+        return self._locks[hash(doc_id) & 15]
+
+    def _register(self, meta: DocumentMeta) -> None:
+        """Add ``meta`` to the in-memory index and record it in the sidecar database."""
+
+        with self._lock_for(meta.doc_id):
+            with self._global_lock:
+                self._documents[meta.doc_id] = meta
+            with self._db_lock, self._meta_db:
+                self._meta_db.execute(
+                    "INSERT OR REPLACE INTO docs (doc_id, name, pages, mtime_ns) VALUES (?, ?, ?, ?)",
+                    (meta.doc_id, meta.name, meta.pages, meta.mtime_ns),
+                )
+
+    def _build_metadata(
+        self, doc_id: str, name: str, path: Path, *, known_page_count: int | None = None
+    ) -> DocumentMeta:
+        """Create metadata for the given file.
+
+        Args:
+            doc_id: Identifier to register the document under.
+            name: Display name of the document.
+            path: Location of the PDF on disk.
+            known_page_count: Page count supplied by a caller that just wrote the
+                file; when given, the PDF is not read at all.
+
+        Returns:
+            Metadata for the document.
+        """
+
+        mtime_ns = path.stat().st_mtime_ns
+        cached = self._page_count_cache.get(path)
+        if known_page_count is not None:
+            pages = known_page_count
+        elif cached is not None and cached[0] == mtime_ns:
+            pages = cached[1]
+        else:
+            pages = self._read_page_count(path)
+        self._page_count_cache[path] = (mtime_ns, pages)
+        return DocumentMeta(doc_id=doc_id, name=name, path=path, pages=pages, mtime_ns=mtime_ns)
+
+    @staticmethod
+    def _read_page_count(path: Path) -> int:
+        """Count the pages of a PDF by walking its page tree.
+
+        The root ``/Pages`` node's ``/Count`` entry is not used: it comes from
+        an untrusted upload, and both pypdf and PDFium take it at face value,
+        so a file claiming more pages than it has would advertise pages that
+        cannot be sliced or rendered. Callers avoid this walk through the
+        mtime-keyed cache, the metadata sidecar and ``known_page_count``.
+        """
+
+        with PdfReader(path, strict=False) as reader:
+            return len(reader.pages)
 
     def _store_writer(self, writer: PdfWriter, filename: str | None = None) -> DocumentMeta:
         """Persist a PDF writer to disk and register it as a new document."""
 
-        output_id = filename or str(uuid.uuid4())
+        output_id = filename or self._next_uuid()
         file_path = self.storage_dir / f"{output_id}.pdf"
+        # pypdf emits many small writes while serializing; collect them in memory
+        # and hand the finished document to the OS in one write call.
+        buffer = BytesIO()
+        writer.write(buffer)
         with file_path.open("wb") as file_obj:
-            writer.write(file_obj)
+            file_obj.write(buffer.getbuffer())
         display_name = f"{output_id}.pdf" if filename is None else filename
-        meta = self._build_metadata(output_id, display_name, file_path)
-        self._documents[output_id] = meta
+        meta = self._build_metadata(
+            output_id, display_name, file_path, known_page_count=len(writer.pages)
+        )
+        self._register(meta)
         return meta
 
     def register_upload(self, file_storage, desired_name: str | None = None) -> DocumentMeta:
         """Store an uploaded PDF and return its metadata."""
 
-        doc_id = str(uuid.uuid4())
+        doc_id = self._next_uuid()
         filename = desired_name or file_storage.filename or f"document-{doc_id}.pdf"
         safe_name = filename.replace(" ", "_")
         file_path = self.storage_dir / f"{doc_id}.pdf"
-        file_storage.save(file_path)
+        self._save_upload(file_storage.stream, file_path)
         meta = self._build_metadata(doc_id, safe_name, file_path)
-        self._documents[doc_id] = meta
+        self._register(meta)
         return meta
 
+    @staticmethod
+    def _save_upload(stream, file_path: Path) -> None:
+        """Copy an uploaded file stream to ``file_path``.
+
+        Werkzeug spools uploads into a ``SpooledTemporaryFile`` that only moves
+        to disk once it grows past 500 KB. Uploads already on disk are copied
+        in-kernel with ``os.sendfile``. Uploads still in memory, and platforms
+        without file-to-file ``sendfile``, use a buffered copy with 1 MiB chunks
+        instead of the 16 KiB default. ``fileno()`` is never called on an
+        in-memory spool, because that would force it to roll over to disk first.
+
+        Args:
+            stream: Readable binary stream of the upload, positioned at its start.
+            file_path: Destination path; created or truncated.
+        """
+
+        with file_path.open("wb") as dst:
+            src_fd = None
+            if not isinstance(stream, SpooledTemporaryFile) or stream._rolled:
+                try:
+                    src_fd = stream.fileno()
+                except (AttributeError, OSError):
+                    src_fd = None
+            if src_fd is not None and hasattr(os, "sendfile"):
+                offset = stream.tell()
+                size = os.fstat(src_fd).st_size
+                try:
+                    while offset < size:
+                        sent = os.sendfile(dst.fileno(), src_fd, offset, size - offset)
+                        if sent == 0:
+                            break
+                        offset += sent
+                    return
+                except OSError:
+                    # sendfile does not move the source position, so the
+                    # buffered copy below can start over from a clean file.
+                    dst.seek(0)
+                    dst.truncate()
+            shutil.copyfileobj(stream, dst, length=1 << 20)
+
+    def close(self) -> None:
+        """Close the metadata sidecar connection. The service must not be used afterwards."""
+
+        with self._db_lock:
+            self._meta_db.close()
+
     def list_documents(self) -> List[Dict[str, str | int]]:
         """Return metadata for all stored documents."""
 
-        return [meta.as_dict() for meta in self._documents.values()]
+        with self._global_lock:
+            snapshot = list(self._documents.values())
+        return [meta.as_dict() for meta in snapshot]
 
     def get_document(self, doc_id: str) -> DocumentMeta:
         """Fetch metadata for a document, raising KeyError if missing."""
@@ -98,15 +446,52 @@ class PdfService:
     def delete_document(self, doc_id: str) -> None:
         """Remove a document from storage and forget its metadata."""
 
-        meta = self.get_document(doc_id)
-        if meta.path.exists():
-            meta.path.unlink()
-        del self._documents[doc_id]
+        with self._lock_for(doc_id):
+            meta = self.get_document(doc_id)
+            if meta.path.exists():
+                meta.path.unlink()
+            with self._global_lock:
+                del self._documents[doc_id]
+            with self._db_lock, self._meta_db:
+                self._meta_db.execute("DELETE FROM docs WHERE doc_id = ?", (doc_id,))
+            self._page_count_cache.pop(meta.path, None)
+            self._invalidate_previews(doc_id)
+
+    def _cache_preview(
+        self, key: tuple[str, int, float, int], data: bytes, meta: DocumentMeta
+    ) -> None:
+        """Insert a rendered preview into the LRU cache and evict to stay within budget.
+
+        Nothing is cached if ``meta`` is no longer the registered document: a
+        delete that ran while the page was rendering has already invalidated the
+        cache, and re-adding the page would resurrect it. ``delete_document``
+        unregisters before it invalidates, so checking under the preview lock
+        cannot miss a delete.
+        """
+
+        with self._preview_lock:
+            if self._documents.get(meta.doc_id) is not meta:
+                return
+            previous = self._preview_cache.pop(key, None)
+            if previous is not None:
+                self._preview_cache_bytes -= len(previous)
+            self._preview_cache[key] = data
+            self._preview_cache_bytes += len(data)
+            while self._preview_cache_bytes > MAX_PREVIEW_BYTES and self._preview_cache:
+                _, evicted = self._preview_cache.popitem(last=False)
+                self._preview_cache_bytes -= len(evicted)
+
+    def _invalidate_previews(self, doc_id: str) -> None:
+        """Drop every cached preview that belongs to ``doc_id``."""
+
+        with self._preview_lock:
+            for key in [key for key in self._preview_cache if key[0] == doc_id]:
+                self._preview_cache_bytes -= len(self._preview_cache.pop(key))
 
     def get_page_previews(
         self, doc_id: str, *, offset: int = 0, limit: int | None = None
     ) -> Dict[str, List[Dict[str, str | int]] | int]:
-        """Return base64 previews for a window of pages in the document.
+        """Return preview image URLs for a window of pages in the document.
 
         Args:
             doc_id: Identifier of the stored document.
@@ -119,10 +504,29 @@ class PdfService:
             ``total_pages`` integer describing the overall document length.
         """
 
-        if pdfium is None:
-            raise RuntimeError(
-                "pypdfium2 is not installed. Install the server requirements to enable previews."
-            )
+        previews = list(self.iter_page_previews(doc_id, offset=offset, limit=limit))
+        return {"pages": previews, "total_pages": self.get_document(doc_id).pages}
+
+    def iter_page_previews(
+        self, doc_id: str, *, offset: int = 0, limit: int | None = None
+    ) -> Iterator[Dict[str, str | int]]:
+        """Yield preview image URLs for a window of pages one at a time.
+
+        Arguments are validated eagerly, so ``KeyError``/``ValueError`` are raised
+        by this call rather than on the first iteration. That lets the HTTP layer
+        report errors before it starts streaming a response.
+
+        Args:
+            doc_id: Identifier of the stored document.
+            offset: Zero-based starting index for the preview window.
+            limit: Maximum number of previews to yield. If ``None``, all remaining
+                pages after ``offset`` are included.
+
+        Returns:
+            Iterator of ``{"index": page_number, "url": preview_url}`` dicts in
+            page order. The image bytes themselves are served by
+            :meth:`render_page_jpeg` so that no pixels travel inside JSON.
+        """
 
         if offset < 0:
             raise ValueError("Offset for previews cannot be negative")
@@ -130,31 +534,55 @@ class PdfService:
             raise ValueError("Limit for previews must be at least 1")
 
         meta = self.get_document(doc_id)
-        pdf = pdfium.PdfDocument(str(meta.path))
-        total_pages = len(pdf)
-        start_index = min(offset, total_pages)
-        end_index = total_pages if limit is None else min(total_pages, start_index + limit)
-
-        previews: List[Dict[str, str | int]] = []
-        for index in range(start_index, end_index):
-            page = pdf[index]
-            try:
-                bitmap = page.render(scale=0.8)
-                image = bitmap.to_pil()
-                bitmap.close()
-            finally:
-                page.close()
-            buffer = BytesIO()
-            image.save(buffer, format="PNG")
-            encoded = base64.b64encode(buffer.getvalue()).decode("utf-8")
-            previews.append(
-                {
-                    "index": index + 1,
-                    "preview": f"data:image/png;base64,{encoded}",
-                }
+        start_index = min(offset, meta.pages)
+        end_index = meta.pages if limit is None else min(meta.pages, start_index + limit)
+        return (
+            {"index": index + 1, "url": f"/api/document/{doc_id}/page/{index + 1}/preview.jpg"}
+            for index in range(start_index, end_index)
+        )
+
+    def render_page_jpeg(
+        self,
+        doc_id: str,
+        index: int,
+        scale: float = PREVIEW_SCALE,
+        quality: int = PREVIEW_QUALITY,
+    ) -> bytes:
+        """Return a JPEG preview of a single page.
+
+        Args:
+            doc_id: Identifier of the stored document.
+            index: Zero-based page index to render.
+            scale: Rendering scale passed through to PDFium.
+            quality: JPEG quality setting (1-95).
+
+        Returns:
+            The encoded JPEG bytes, served from the preview cache when possible.
+        """
+
+        if pdfium is None:
+            raise RuntimeError(
+                "pypdfium2 is not installed. Install the server requirements to enable previews."
             )
-        pdf.close()
-        return {"pages": previews, "total_pages": total_pages}
+
+        meta = self.get_document(doc_id)
+        if index < 0 or index >= meta.pages:
+            raise ValueError(f"Page {index + 1} is out of bounds for document with {meta.pages} pages")
+
+        key = (doc_id, index, scale, quality)
+        with self._preview_lock:
+            data = self._preview_cache.get(key)
+            if data is not None:
+                self._preview_cache.move_to_end(key)
+                return data
+
+        try:
+            data = _run_render(str(meta.path), index, scale, quality)
+        except FileNotFoundError as exc:
+            # The document was deleted after it was looked up above.
+            raise KeyError(f"Document {doc_id} not found") from exc
+        self._cache_preview(key, data, meta)
+        return data
 
     def slice_document(
         self,
@@ -165,9 +593,9 @@ class PdfService:
     ) -> DocumentMeta:
         """Create a new PDF using either a contiguous range or explicit page numbers."""
 
+        # All validation runs against the cached page count, so a bad request is
+        # rejected before the source PDF is opened at all.
         meta = self.get_document(doc_id)
-        reader = PdfReader(meta.path)
-        writer = PdfWriter()
 
         page_numbers: Sequence[int]
         if pages:
@@ -177,26 +605,65 @@ class PdfService:
                 raise ValueError("start_page and end_page are required when no pages are provided")
             if start_page < 1 or end_page > meta.pages or start_page > end_page:
                 raise ValueError("Invalid page range for slicing")
-            page_numbers = list(range(start_page, end_page + 1))
+            page_numbers = range(start_page, end_page + 1)
+
+        if len(page_numbers) > MAX_PAGES_PER_SLICE:
+            raise ValueError(f"A slice may contain at most {MAX_PAGES_PER_SLICE} pages")
 
-        for page_number in page_numbers:
-            writer.add_page(reader.pages[page_number - 1])
+        writer = PdfWriter()
+        # Hold the source's shard while reading it so a concurrent delete cannot
+        # remove the file mid-copy. The shard is released before storing, since
+        # the new document's id may hash to the same shard.
+        with self._lock_for(doc_id):
+            meta = self.get_document(doc_id)
+            # Let pypdf open the source once and copy the selected pages (and the
+            # objects they share) in a single pass instead of resolving them one by one.
+            try:
+                writer.append(
+                    meta.path,
+                    pages=[page_number - 1 for page_number in page_numbers],
+                    import_outline=False,
+                )
+            except (IndexError, PyPdfError) as exc:
+                raise ValueError(f"Could not copy pages from document {doc_id}: {exc}") from exc
         return self._store_writer(writer)
 
     def _normalize_page_list(self, pages: Iterable[int], max_pages: int) -> List[int]:
         """Validate a collection of page numbers and return a sorted, unique list."""
 
+        candidate = pages if isinstance(pages, list) else list(pages)
+
+        # Fast path: selections built from ranges are usually already strictly
+        # increasing in-range ints, which are exactly the normalized form.
+        previous = 0
+        for page in candidate:
+            if type(page) is not int or page <= previous or page > max_pages:
+                break
+            previous = page
+        else:
+            if candidate:
+                return list(candidate)
+
         try:
-            normalized = sorted({int(page) for page in pages})
+            normalized = sorted(set(map(int, candidate)))
         except (TypeError, ValueError) as exc:  # pragma: no cover - defensive programming
             raise ValueError("Pages must be integers") from exc
 
         if not normalized:
             raise ValueError("No pages supplied for slicing")
 
-        for page in normalized:
-            if page < 1 or page > max_pages:
-                raise ValueError(f"Page {page} is out of bounds for document with {max_pages} pages")
+        # The list is sorted, so only its ends need checking; bisect finds the
+        # first page past the end to keep the error message specific.
+        if normalized[0] < 1:
+            raise ValueError(
+                f"Page {normalized[0]} is out of bounds for document with {max_pages} pages"
+            )
+        if normalized[-1] > max_pages:
+            page = normalized[bisect_right(normalized, max_pages)]
+            raise ValueError(f"Page {page} is out of bounds for document with {max_pages} pages")
         return normalized
 
 
+# A forked worker would otherwise inherit, and hand out again, the identifiers
+# already sitting in its parent's pool.
+os.register_at_fork(after_in_child=PdfService._uuid_pool.clear)
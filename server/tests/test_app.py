@@ -0,0 +1,123 @@
+"""Route-level tests for the Flask application."""
+import json
+from pathlib import Path
+
+import pytest
+from pypdf import PdfWriter
+
+from server import app as app_module
+from server.pdf_manager import PdfService
+
+
+def _make_source_pdf(storage: Path, page_count: int = 3) -> None:
+    writer = PdfWriter()
+    for _ in range(page_count):
+        writer.add_blank_page(width=200, height=200)
+    with (storage / "sample.pdf").open("wb") as file_obj:
+        writer.write(file_obj)
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    storage = tmp_path / "storage"
+    storage.mkdir()
+    _make_source_pdf(storage)
+    service = PdfService(storage)
+    monkeypatch.setattr(app_module, "_service", service)
+    yield service
+    service.close()
+
+
+@pytest.fixture
+def client(service):
+    return app_module.app.test_client()
+
+
+def test_download_supports_conditional_requests(client, service):
+    stat = service.get_document("sample").path.stat()
+
+    response = client.get("/api/document/sample/download")
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] == f'"sample-{stat.st_mtime_ns}-{stat.st_size}"'
+    assert response.headers["Cache-Control"] == "private, max-age=60, must-revalidate"
+    response.close()
+
+    cached = client.get(
+        "/api/document/sample/download", headers={"If-None-Match": response.headers["ETag"]}
+    )
+
+    assert cached.status_code == 304
+    assert cached.data == b""
+
+
+def test_list_documents_serializes(client, service):
+    response = client.get("/api/documents")
+
+    assert response.status_code == 200
+    assert response.get_json() == {"documents": [service.get_document("sample").as_dict()]}
+
+
+def test_slice_accepts_json_object(client):
+    response = client.post("/api/document/sample/slice", data=b'{"pages": [1, 3]}')
+
+    assert response.status_code == 200
+    assert response.get_json()["document"]["pages"] == 2
+
+
+@pytest.mark.parametrize("body", [b"{not json", b"[1]"])
+def test_slice_rejects_non_object_body(client, body):
+    response = client.post("/api/document/sample/slice", data=body)
+
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "Request body must be a JSON object"}
+
+
+def test_pages_streams_ndjson(client):
+    response = client.get("/api/document/sample/pages?offset=1")
+
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert lines == [
+        {"total_pages": 3},
+        {"index": 2, "url": "/api/document/sample/page/2/preview.jpg"},
+        {"index": 3, "url": "/api/document/sample/page/3/preview.jpg"},
+    ]
+
+
+def test_pages_unknown_document_returns_404(client):
+    assert client.get("/api/document/missing/pages").status_code == 404
+
+
+def test_preview_image_supports_conditional_requests(client, service):
+    response = client.get("/api/document/sample/page/1/preview.jpg")
+
+    assert response.status_code == 200
+    assert response.mimetype == "image/jpeg"
+    assert response.data.startswith(b"\xff\xd8")
+    mtime_ns = service.get_document("sample").path.stat().st_mtime_ns
+    assert response.headers["ETag"] == f'"sample-{mtime_ns}-0-0.8-75"'
+
+    cached = client.get(
+        "/api/document/sample/page/1/preview.jpg",
+        headers={"If-None-Match": response.headers["ETag"]},
+    )
+
+    assert cached.status_code == 304
+    assert cached.data == b""
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "/api/document/sample/page/4/preview.jpg",
+        "/api/document/sample/page/0/preview.jpg",
+        "/api/document/missing/page/1/preview.jpg",
+    ],
+)
+def test_preview_image_not_found(client, url):
+    response = client.get(url)
+
+    assert response.status_code == 404
+    assert "error" in response.get_json()
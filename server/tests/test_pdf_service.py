@@ -1,8 +1,18 @@
 """Unit tests for PdfService slicing helpers."""
+from io import BytesIO
 from pathlib import Path
+from tempfile import SpooledTemporaryFile
+import os
+import signal
 
+import pytest
 from pypdf import PdfReader, PdfWriter
+from pypdf.generic import NameObject, NumberObject
+from werkzeug.datastructures import FileStorage
+from werkzeug.test import EnvironBuilder
+from werkzeug.wrappers import Request
 
+from server import pdf_manager
 from server.pdf_manager import PdfService
 
 
@@ -15,11 +25,103 @@ def _make_source_pdf(tmp_path: Path, page_count: int = 5) -> None:
         writer.write(file_obj)
 
 
+def _make_pdf_with_count(path: Path, page_count: int, claimed_count: int | None) -> None:
+    """Write a PDF whose root ``/Count`` is ``claimed_count`` (or absent if ``None``)."""
+
+    writer = PdfWriter()
+    for _ in range(page_count):
+        writer.add_blank_page(width=200, height=200)
+    pages_root = writer._root_object["/Pages"].get_object()
+    if claimed_count is None:
+        del pages_root[NameObject("/Count")]
+    else:
+        pages_root[NameObject("/Count")] = NumberObject(claimed_count)
+    with path.open("wb") as file_obj:
+        writer.write(file_obj)
+
+
 def _page_widths(path: Path) -> list[int]:
     reader = PdfReader(path)
     return [int(page.mediabox.width) for page in reader.pages]
 
 
+def test_render_recovers_from_killed_worker(tmp_path):
+    storage = tmp_path / "storage"
+    storage.mkdir()
+    _make_source_pdf(storage)
+    service = PdfService(storage)
+    service.render_page_jpeg("sample", 0)
+    broken_pool = pdf_manager._RENDER_POOL
+
+    for pid in list(broken_pool._processes):
+        os.kill(pid, signal.SIGKILL)
+
+    assert service.render_page_jpeg("sample", 1).startswith(b"\xff\xd8")
+    assert pdf_manager._RENDER_POOL is not broken_pool
+
+
+def test_render_page_jpeg_caches_per_quality(tmp_path):
+    storage = tmp_path / "storage"
+    storage.mkdir()
+    _make_source_pdf(storage)
+    service = PdfService(storage)
+
+    high = service.render_page_jpeg("sample", 0, quality=95)
+    low = service.render_page_jpeg("sample", 0, quality=10)
+
+    assert high is not low
+    assert len(service._preview_cache) == 2
+
+
+@pytest.mark.parametrize("render_reaches_worker", [False, True])
+def test_delete_during_render_is_not_recached(tmp_path, monkeypatch, render_reaches_worker):
+    storage = tmp_path / "storage"
+    storage.mkdir()
+    _make_source_pdf(storage)
+    service = PdfService(storage)
+    real_run_render = pdf_manager._run_render
+
+    def render_after_delete(*args):
+        service.delete_document("sample")
+        # Either the worker finds the file gone, or the render had already
+        # finished before the delete landed.
+        return real_run_render(*args) if render_reaches_worker else b"jpeg"
+
+    monkeypatch.setattr(pdf_manager, "_run_render", render_after_delete)
+    if render_reaches_worker:
+        with pytest.raises(KeyError):
+            service.render_page_jpeg("sample", 0)
+    else:
+        service.render_page_jpeg("sample", 0)
+
+    assert len(service._preview_cache) == 0
+    assert service._preview_cache_bytes == 0
+
+
+def _crash_render(*args):
+    """Stand-in for ``_render_page_jpeg`` that kills its worker process."""
+
+    os._exit(1)
+
+
+def test_render_that_always_crashes_spares_shared_pool(tmp_path, monkeypatch):
+    storage = tmp_path / "storage"
+    storage.mkdir()
+    _make_source_pdf(storage)
+    service = PdfService(storage)
+
+    monkeypatch.setattr(pdf_manager, "_render_page_jpeg", _crash_render)
+    with pytest.raises(RuntimeError, match="page 1 crashes"):
+        service.render_page_jpeg("sample", 0)
+    replacement_pool = pdf_manager._RENDER_POOL
+    monkeypatch.undo()
+
+    # Only the first crash replaced the shared pool; the isolated retry did not
+    # break the replacement, which still renders other pages.
+    assert service.render_page_jpeg("sample", 1).startswith(b"\xff\xd8")
+    assert pdf_manager._RENDER_POOL is replacement_pool
+
+
 def test_slice_by_range(tmp_path):
     storage = tmp_path / "storage"
     storage.mkdir()
@@ -45,6 +147,89 @@ def test_slice_by_explicit_pages(tmp_path):
     assert _page_widths(storage / f"{result.doc_id}.pdf") == [210, 230, 240]
 
 
+@pytest.mark.parametrize("claimed_count", [10, None])
+def test_page_count_ignores_untrusted_count(tmp_path, claimed_count):
+    storage = tmp_path / "storage"
+    storage.mkdir()
+    _make_pdf_with_count(storage / "sample.pdf", page_count=3, claimed_count=claimed_count)
+    service = PdfService(storage)
+
+    assert service.get_document("sample").pages == 3
+    with pytest.raises(ValueError):
+        service.slice_document("sample", start_page=1, end_page=5)
+    assert service.slice_document("sample", start_page=1, end_page=3).pages == 3
+
+
+def test_slice_rejects_too_many_pages(tmp_path, monkeypatch):
+    storage = tmp_path / "storage"
+    storage.mkdir()
+    _make_source_pdf(storage)
+    service = PdfService(storage)
+    monkeypatch.setattr(pdf_manager, "MAX_PAGES_PER_SLICE", 2)
+
+    with pytest.raises(ValueError):
+        service.slice_document("sample", start_page=1, end_page=3)
+    with pytest.raises(ValueError):
+        service.slice_document("sample", pages=[1, 2, 3])
+
+
+@pytest.mark.parametrize("spooled_to_disk", [False, True])
+def test_register_upload_copies_stream(tmp_path, spooled_to_disk):
+    storage = tmp_path / "storage"
+    storage.mkdir()
+    _make_source_pdf(tmp_path)
+    payload = (tmp_path / "sample.pdf").read_bytes()
+    stream = (tmp_path / "sample.pdf").open("rb") if spooled_to_disk else BytesIO(payload)
+    service = PdfService(storage)
+
+    with stream:
+        meta = service.register_upload(FileStorage(stream, filename="my file.pdf"))
+
+    assert meta.name == "my_file.pdf"
+    assert meta.pages == 5
+    assert meta.path.read_bytes() == payload
+
+
+def test_register_upload_keeps_small_multipart_upload_in_memory(tmp_path):
+    storage = tmp_path / "storage"
+    storage.mkdir()
+    _make_source_pdf(tmp_path)
+    payload = (tmp_path / "sample.pdf").read_bytes()
+    builder = EnvironBuilder(
+        method="POST", data={"file": (BytesIO(payload), "sample.pdf", "application/pdf")}
+    )
+    request = Request(builder.get_environ())
+    upload = request.files["file"]
+    service = PdfService(storage)
+
+    meta = service.register_upload(upload)
+
+    assert isinstance(upload.stream, SpooledTemporaryFile)
+    assert not upload.stream._rolled
+    assert meta.path.read_bytes() == payload
+
+
+def test_restart_reuses_sidecar_metadata(tmp_path, monkeypatch):
+    storage = tmp_path / "storage"
+    storage.mkdir()
+    _make_source_pdf(tmp_path)
+    service = PdfService(storage)
+    with (tmp_path / "sample.pdf").open("rb") as stream:
+        uploaded = service.register_upload(FileStorage(stream, filename="report.pdf"))
+    service.close()
+
+    def fail(path):
+        raise AssertionError(f"{path} should not be parsed again")
+
+    monkeypatch.setattr(PdfService, "_read_page_count", staticmethod(fail))
+    restarted = PdfService(storage)
+    try:
+        assert restarted.get_document(uploaded.doc_id).name == "report.pdf"
+        assert restarted.get_document(uploaded.doc_id).pages == 5
+    finally:
+        restarted.close()
+
+
 def test_delete_document_removes_file(tmp_path):
     storage = tmp_path / "storage"
     storage.mkdir()
@@ -55,3 +240,35 @@ def test_delete_document_removes_file(tmp_path):
 
     assert not (storage / "sample.pdf").exists()
     assert service.list_documents() == []
+
+
+def test_page_previews_window(tmp_path):
+    storage = tmp_path / "storage"
+    storage.mkdir()
+    _make_source_pdf(storage)
+    service = PdfService(storage)
+
+    result = service.get_page_previews("sample", offset=1, limit=3)
+
+    assert result["total_pages"] == 5
+    assert [page["index"] for page in result["pages"]] == [2, 3, 4]
+    assert result["pages"][0]["url"] == "/api/document/sample/page/2/preview.jpg"
+
+
+def test_render_page_jpeg_is_cached_until_delete(tmp_path):
+    storage = tmp_path / "storage"
+    storage.mkdir()
+    _make_source_pdf(storage)
+    service = PdfService(storage)
+
+    first = service.render_page_jpeg("sample", 0)
+    second = service.render_page_jpeg("sample", 0)
+
+    assert first.startswith(b"\xff\xd8")
+    assert first is second
+    assert len(service._preview_cache) == 1
+
+    service.delete_document("sample")
+
+    assert len(service._preview_cache) == 0
+    assert service._preview_cache_bytes == 0